@@ -1,6 +1,4 @@
 import streamlit as st
-from src.pages.test_generation import show_test_generation_page
-from src.pages.test_list import show_question_list_page
 from components.sidebar import create_sidebar
 from components.welcome import show_welcome_page
 
@@ -16,18 +14,20 @@ def main():
     )
 
     # Read query params and set selected_page if present
-    query_params = st.query_params
-    page_from_url = query_params.get("page", [None])[0] if isinstance(query_params.get("page", None), list) else query_params.get("page", None)
-    if page_from_url and "selected_page" not in st.session_state:
-        st.session_state.selected_page = page_from_url
+    page_from_url = st.query_params.get("page")
+    if page_from_url:
+        st.session_state.setdefault("selected_page", page_from_url)
 
     # Create sidebar and get selected page
     selected_page = create_sidebar()
 
-    # Route to appropriate page
+    # Route to appropriate page; page modules are imported lazily so the welcome
+    # page does not pay for loading LangGraph and the Gemini SDK
     if selected_page == "new_test":
+        from src.pages.test_generation import show_test_generation_page
         show_test_generation_page()
     elif selected_page == "list_tests":
+        from src.pages.test_list import show_question_list_page
         show_question_list_page()
     else:
         show_welcome_page()
@@ -1,5 +1,75 @@
+import html
+import json
+import pandas as pd
 import streamlit as st
 from typing import List, Dict, Any
+from utils.question_html import OPTION_KEYS, build_options_html, highlight_options_html
+
+# Number of test sets rendered per page in the list view
+PAGE_SIZE = 20
+# Number of questions revealed initially and per "Load more" click
+LOAD_MORE_STEP = 16
+
+# Inline styles for the feedback shown once an interactive question is answered
+_CORRECT_BOX_STYLE = "color: #256029; background-color: #E8F5E9; padding: 12px 16px; border-radius: 8px; margin-bottom: 8px;"
+_INCORRECT_BOX_STYLE = "color: #B71C1C; background-color: #FFEBEE; padding: 12px 16px; border-radius: 8px; margin-bottom: 8px;"
+_EXPLANATION_BOX_STYLE = "color: #0D47A1; background-color: #E3F2FD; padding: 12px 16px; border-radius: 8px; margin-bottom: 8px;"
+_EMPTY_FEEDBACK_HTML = "<div style='min-height:64px'></div>"
+
+
+def _fmt(option):
+    """Format a (letter, text) option tuple for the answer radio."""
+    return f"{option[0]}. {option[1]}"
+
+
+def _store_selection(question_key, radio_widget_key):
+    """Radio on_change callback: persist the chosen option letter for the question."""
+    radio_val = st.session_state.get(radio_widget_key, None)
+    if radio_val is not None:
+        # Only store the letter if it's a tuple
+        if isinstance(radio_val, tuple):
+            st.session_state[question_key]["sel"] = radio_val[0]
+        else:
+            st.session_state[question_key]["sel"] = radio_val
+
+
+def _metadata_markdown(test_set: Dict[str, Any]) -> str:
+    """One-line metadata header for a test set, emitted as a single markdown element."""
+    metadata = test_set.get('metadata', {})
+    return (
+        f"**Technology:** {metadata.get('technology', 'N/A')} &nbsp;·&nbsp; "
+        f"**Test:** {test_set.get('title', 'Test Details')} &nbsp;·&nbsp; "
+        f"**Difficulty:** {metadata.get('difficulty', 'N/A')} &nbsp;·&nbsp; "
+        f"**Total:** {test_set['total_tests']}"
+    )
+
+
+def _distribution_frame(distribution: Dict[str, int]) -> pd.DataFrame:
+    """Turn a {label: count} distribution into a single-column frame for st.bar_chart."""
+    return pd.DataFrame.from_dict(distribution, orient='index', columns=['Questions'])
+
+
+# Bounded: the cache key is the JSON of every question ever rendered
+@st.cache_data(show_spinner=False, max_entries=1000)
+def _render_single_test_html(test_json: str) -> str:
+    """Build the read-only HTML block for a question; keyed by its JSON so saved questions render once."""
+    test = json.loads(test_json)
+    options = test.get('options', {})
+    answer = test.get('answer', {})
+    correct_key = answer.get('answer', '')
+    parts = [f"<div><b>Question:</b> {html.escape(str(test.get('question', '')))}</div>", "<div><b>Options:</b></div>"]
+    for key, option in options.items():
+        if key == correct_key:
+            parts.append(f"<div>✅ <b>{html.escape(str(option))}</b></div>")
+        else:
+            parts.append(f"<div>{html.escape(str(option))}</div>")
+    explanation = answer.get('explanation', '')
+    if explanation:
+        parts.append(f"<div><b>Explanation:</b> {html.escape(str(explanation))}</div>")
+    parts.append(f"<div><b>Difficulty:</b> {html.escape(str(test.get('difficulty', 'N/A')))}</div>")
+    parts.append(f"<div><b>Technology:</b> {html.escape(str(test.get('technology', 'N/A')))}</div>")
+    return "".join(parts)
+
 
 class QuestionListView:
     """Component for displaying tests in list format."""
@@ -7,6 +77,29 @@ class QuestionListView:
     def __init__(self):
         pass
     
+    def render_paginated(self, test_sets: List[Dict[str, Any]]):
+        """Render test sets one page at a time so only PAGE_SIZE rows are built per rerun."""
+        total_pages = max(1, (len(test_sets) + PAGE_SIZE - 1) // PAGE_SIZE)
+        page = st.session_state.setdefault("list_page", 0)
+        # Clamp the page index in case test sets were removed since the last rerun
+        if page >= total_pages:
+            page = st.session_state.list_page = total_pages - 1
+        page_slice = test_sets[page * PAGE_SIZE:(page + 1) * PAGE_SIZE]
+        for test_set in page_slice:
+            self.render_question_set(test_set)
+        if total_pages > 1:
+            col1, col2, col3 = st.columns([1, 2, 1])
+            with col1:
+                if st.button("⬅️ Prev", key="list_prev_btn", disabled=page == 0):
+                    st.session_state.list_page = page - 1
+                    st.rerun()
+            with col2:
+                st.markdown(f"Page {page + 1} of {total_pages}")
+            with col3:
+                if st.button("Next ➡️", key="list_next_btn", disabled=page >= total_pages - 1):
+                    st.session_state.list_page = page + 1
+                    st.rerun()
+    
     def render_question_set(self, test_set: Dict[str, Any]):
         """Render a single test set."""
         test_id = test_set.get('id', '')
@@ -24,28 +117,16 @@ class QuestionListView:
                 st.markdown(f"**Test Name:** {test_set.get('title', 'Test Details')}")
             with col3:
                 st.markdown(f"**Difficulty:** {metadata.get('difficulty', 'N/A')}")
-            st.markdown(f"**Total Questions:** {test_set.get('total_tests', len(test_set.get('tests', [])))}")
+            st.markdown(f"**Total Questions:** {test_set['total_tests']}")
             # Action buttons
-            col1, col2, col3, col4 = st.columns(4)
-            with col1:
-                if st.button("👁️ View", key=f"view_{test_id}"):
-                    st.session_state['selected_test_id'] = test_id
-                    st.rerun()
-            with col2:
-                pass
-            with col3:
-                pass
-            with col4:
-                pass
+            if st.button("👁️ View", key=f"view_{test_id}"):
+                st.session_state['selected_test_id'] = test_id
+                st.rerun()
     
     def show_test_details(self, test_set: Dict[str, Any]):
         """Show detailed view of a test set."""
         st.subheader(f"📄 {test_set.get('title', 'Test Details')}")
-        metadata = test_set.get('metadata', {})
-        st.markdown(f"**Technology:** {metadata.get('technology', 'N/A')}")
-        st.markdown(f"**Test Name:** {test_set.get('title', 'Test Details')}")
-        st.markdown(f"**Difficulty:** {metadata.get('difficulty', 'N/A')}")
-        st.markdown(f"**Total Questions:** {test_set.get('total_tests', len(test_set.get('tests', [])))}")
+        st.markdown(_metadata_markdown(test_set))
         
         tests = test_set.get('tests', [])
         for i, test in enumerate(tests, 1):
@@ -54,27 +135,7 @@ class QuestionListView:
     
     def render_single_test(self, test: Dict[str, Any]):
         """Render a single test with all details."""
-        st.markdown(f"**Question:** {test.get('question', '')}")
-        
-        # Options (dict)
-        options = test.get('options', {})
-        answer = test.get('answer', {})
-        correct_key = answer.get('answer', '')
-        st.markdown("**Options:**")
-        for key, option in options.items():
-            if key == correct_key:
-                st.markdown(f"✅ **{option}")
-            else:
-                st.markdown(f"{option}")
-        
-        # Explanation
-        explanation = answer.get('explanation', '')
-        if explanation:
-            st.markdown(f"**Explanation:** {explanation}")
-        
-        # Difficulty
-        st.markdown(f"**Difficulty:** {test.get('difficulty', 'N/A')}")
-        st.markdown(f"**Technology:** {test.get('technology', 'N/A')}")
+        st.markdown(_render_single_test_html(json.dumps(test, sort_keys=True)), unsafe_allow_html=True)
     
     def download_tests(self, test_set: Dict[str, Any]):
         st.success(f"Downloading {test_set.get('title', 'tests')}...")
@@ -111,102 +172,87 @@ class QuestionListView:
         st.subheader("📊 Difficulty Distribution")
         difficulty_data = analytics.get('difficulty_distribution', {})
         if difficulty_data:
-            max_count = max(difficulty_data.values()) if difficulty_data else 1
-            for difficulty, count in difficulty_data.items():
-                st.progress(count / max_count if max_count > 0 else 0)
-                st.markdown(f"**{difficulty}:** {count} questions")
+            st.bar_chart(_distribution_frame(difficulty_data))
         st.subheader("📚 Technology Distribution")
         technology_data = analytics.get('technology_distribution', {})
         if technology_data:
-            max_count = max(technology_data.values()) if technology_data else 1
-            for technology, count in technology_data.items():
-                st.progress(count / max_count if max_count > 0 else 0)
-                st.markdown(f"**{technology}:** {count} questions") 
+            st.bar_chart(_distribution_frame(technology_data))
 
     def render_interactive_test_page(self, test_set: Dict[str, Any]):
         """Show a dedicated interactive Q&A page for a test set."""
         st.subheader(f"📄 {test_set.get('title', 'Test Details')}")
-        metadata = test_set.get('metadata', {})
-        st.markdown(f"**Technology:** {metadata.get('technology', 'N/A')}")
-        st.markdown(f"**Test Name:** {test_set.get('title', 'Test Details')}")
-        st.markdown(f"**Difficulty:** {metadata.get('difficulty', 'N/A')}")
-        st.markdown(f"**Total Questions:** {test_set.get('total_tests', len(test_set.get('tests', [])))}")
+        st.markdown(_metadata_markdown(test_set))
         st.markdown("---")
         tests = test_set.get('tests', [])
-        for i, test in enumerate(tests, 1):
+        test_id = test_set.get('id', '')
+        visible_key = f"visible_{test_id}"
+        visible = st.session_state.setdefault(visible_key, LOAD_MORE_STEP)
+        for i, test in enumerate(tests[:visible], 1):
             with st.expander(f"Question {i}: {test.get('question', 'No question text')[:50]}..."):
-                self.render_interactive_single_test(test, i, test_set.get('id', ''))
+                self.render_interactive_single_test(test, i, test_id)
+        if visible < len(tests):
+            if st.button(f"Load {LOAD_MORE_STEP} more", key=f"load_more_{test_id}"):
+                st.session_state[visible_key] += LOAD_MORE_STEP
+                st.rerun()
         if st.button("⬅️ Back to List", key="back_to_list_btn"):
             st.session_state['selected_test_id'] = None
             st.rerun()
 
+    @st.fragment
     def render_interactive_single_test(self, test: Dict[str, Any], idx: int, test_id: str):
-        """Render a single test as interactive Q&A (radio, highlight, explanation)."""
+        """Render a single test as interactive Q&A (radio, highlight, explanation).
+
+        Runs as a fragment so answering or resetting a question only reruns this card.
+        """
         st.markdown(f"**Question:** {test.get('question', '')}")
         options = test.get('options', {})
+        opts_tuple = tuple((k, options.get(k, '')) for k in OPTION_KEYS)
         answer = test.get('answer', {})
         correct_key = answer.get('answer', '')
         explanation = answer.get('explanation', '')
-        radio_key = f"selected_{test_id}_{idx}"
-        version_key = f"{radio_key}_version"
-        if version_key not in st.session_state:
-            st.session_state[version_key] = 0
-        radio_version = st.session_state[version_key]
-        radio_widget_key = f"{radio_key}_v{radio_version}"
-        selected = st.session_state.get(radio_key, None)
-
-        # Always define placeholders at the top
+        # Selection and radio version live in one session_state entry per question
+        question_key = f"q_{test_id}_{idx}"
+        question_state = st.session_state.setdefault(question_key, {"sel": None, "ver": 0})
+        radio_widget_key = f"{question_key}_v{question_state['ver']}"
+        selected = question_state["sel"]
+
+        # Always define the feedback placeholder at the top
         feedback_placeholder = st.empty()
-        explanation_placeholder = st.empty()
 
         if selected is None:
-            selected_val = st.radio(
+            # The selection is stored by the on_change callback before the next rerun
+            st.radio(
                 "Select your answer:",
-                options=[(k, options.get(k, '')) for k in ['a', 'b', 'c', 'd']],
-                format_func=lambda x: f"{x[0]}. {x[1]}",
+                options=opts_tuple,
+                format_func=_fmt,
                 key=radio_widget_key,
                 index=None,  # No default selection
-                disabled=False
+                disabled=False,
+                on_change=_store_selection,
+                args=(question_key, radio_widget_key)
             )
-            # If the user made a selection, store it in session_state and rerun
-            radio_val = st.session_state.get(radio_widget_key, None)
-            if radio_val is not None:
-                # Only store the letter if it's a tuple
-                if isinstance(radio_val, tuple):
-                    st.session_state[radio_key] = radio_val[0]
-                else:
-                    st.session_state[radio_key] = radio_val
-                st.rerun()
-            # Render feedback and explanation placeholders directly below options
-            feedback_placeholder.markdown("<div style='min-height:32px'></div>", unsafe_allow_html=True)
-            explanation_placeholder.markdown("<div style='min-height:32px'></div>", unsafe_allow_html=True)
+            # Reserve space for feedback and explanation in a single element
+            feedback_placeholder.markdown(_EMPTY_FEEDBACK_HTML, unsafe_allow_html=True)
         else:
             # If value is a tuple (from previous run), extract the letter
             if isinstance(selected, tuple):
                 selected_letter = selected[0]
             else:
                 selected_letter = selected
-            # Only show colored markdown options, not the radio button
-            for k in ['a', 'b', 'c', 'd']:
-                opt_text = options.get(k, '')
-                if k == correct_key:
-                    # Light green background for correct answer
-                    st.markdown(f"<span style='color: #256029; background-color: #C8E6C9; padding: 4px 8px; border-radius: 4px; display: inline-block;'><b>{k}. {opt_text}</b></span>", unsafe_allow_html=True)
-                elif k == selected_letter:
-                    # Light red background for incorrect selection
-                    st.markdown(f"<span style='color: #B71C1C; background-color: #FFCDD2; padding: 4px 8px; border-radius: 4px; display: inline-block;'><b>{k}. {opt_text}</b></span>", unsafe_allow_html=True)
-                else:
-                    st.markdown(f"{k}. {opt_text}")
+            # Feedback and explanation are emitted together as one HTML block
             if selected_letter == correct_key:
-                feedback_placeholder.success("Correct! 🎉")
+                feedback_html = f"<div style='{_CORRECT_BOX_STYLE}'>Correct! 🎉</div>"
             else:
-                feedback_placeholder.error(f"Incorrect. The correct answer is **{correct_key}**.")
+                feedback_html = f"<div style='{_INCORRECT_BOX_STYLE}'>Incorrect. The correct answer is <b>{html.escape(str(correct_key))}</b>.</div>"
             if explanation:
-                explanation_placeholder.info(f"**Explanation:** {explanation}")
-            else:
-                explanation_placeholder.markdown("<div style='min-height:32px'></div>", unsafe_allow_html=True)
+                feedback_html += f"<div style='{_EXPLANATION_BOX_STYLE}'><b>Explanation:</b> {html.escape(str(explanation))}</div>"
+            feedback_placeholder.markdown(f"<div style='min-height:64px'>{feedback_html}</div>", unsafe_allow_html=True)
+            # Only show colored options, not the radio button. The neutral options HTML is
+            # precomputed at generation time; older tests fall back to building it here.
+            options_html = test.get('options_html') or build_options_html(options)
+            st.markdown(highlight_options_html(options_html, correct_key, selected_letter), unsafe_allow_html=True)
             # Add Reset Answer button
             if st.button("Reset Answer", key=f"reset_{test_id}_{idx}"):
-                st.session_state.pop(radio_key, None)
-                st.session_state[version_key] += 1
-                st.rerun() 
\ No newline at end of file
+                question_state["sel"] = None
+                question_state["ver"] += 1
+                st.rerun(scope="fragment") 
\ No newline at end of file
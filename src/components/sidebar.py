@@ -1,10 +1,14 @@
 import streamlit as st
 
+def _goto(page):
+    """Select a page in session state and mirror it in the URL in one update."""
+    st.session_state.selected_page = page
+    st.query_params.update({"page": page})
+
 def create_sidebar():
     """Create the sidebar with navigation options."""
     # Initialize session state for page selection
-    if 'selected_page' not in st.session_state:
-        st.session_state.selected_page = "welcome"
+    st.session_state.setdefault('selected_page', "welcome")
     
     # Sidebar header
     st.sidebar.title("📚 Test Generation")
@@ -25,11 +29,9 @@ def create_sidebar():
     
     # Update session state based on button clicks
     if new_test_selected:
-        st.session_state.selected_page = "new_test"
-        st.query_params["page"] = "new_test"
+        _goto("new_test")
     elif list_tests_selected:
-        st.session_state.selected_page = "list_tests"
-        st.query_params["page"] = "list_tests"
+        _goto("list_tests")
 
     # Add some space before the help button
     st.sidebar.markdown("<div style='height: 8rem;'></div>", unsafe_allow_html=True)
@@ -40,8 +42,7 @@ def create_sidebar():
         key="help_btn"
     )
     if help_selected:
-        st.session_state.selected_page = "welcome"
-        st.query_params["page"] = "welcome"
+        _goto("welcome")
 
     # Return selected page from session state
     return st.session_state.selected_page 
\ No newline at end of file
@@ -1,6 +1,47 @@
 import streamlit as st
 
 
+_TECHNOLOGIES: tuple[str, ...] = (
+    "Python",
+    "JavaScript",
+    "Java",
+    "C++",
+    "C#",
+    "PHP",
+    "Ruby",
+    "Go",
+    "Rust",
+    "Swift",
+    "React",
+    "Angular",
+    "Vue.js",
+    "Node.js",
+    "Django",
+    "Flask",
+    "Spring Boot",
+    "Laravel",
+    "MySQL",
+    "PostgreSQL",
+    "MongoDB",
+    "Redis",
+    "Docker",
+    "Kubernetes",
+    "AWS",
+    "Azure",
+    "Machine Learning",
+    "Data Science",
+    "DevOps",
+    "Cybersecurity",
+    "Web Development",
+    "Mobile Development",
+    "Game Development",
+    "Blockchain",
+    "Cloud Computing",
+)
+
+_DIFFICULTIES: tuple[str, ...] = ("Easy", "Medium", "Hard")
+
+
 class TestForm:
     """Component for test generation form."""
 
@@ -23,49 +64,10 @@ class TestForm:
             num_questions = st.number_input(
                 "Number of Questions", min_value=1, max_value=50, value=5
             )
-            difficulty = st.selectbox("Difficulty Level", ["Easy", "Medium", "Hard"])
+            difficulty = st.selectbox("Difficulty Level", _DIFFICULTIES)
 
         with col2:
-            technology = st.selectbox(
-                "Technology",
-                [
-                    "Python",
-                    "JavaScript",
-                    "Java",
-                    "C++",
-                    "C#",
-                    "PHP",
-                    "Ruby",
-                    "Go",
-                    "Rust",
-                    "Swift",
-                    "React",
-                    "Angular",
-                    "Vue.js",
-                    "Node.js",
-                    "Django",
-                    "Flask",
-                    "Spring Boot",
-                    "Laravel",
-                    "MySQL",
-                    "PostgreSQL",
-                    "MongoDB",
-                    "Redis",
-                    "Docker",
-                    "Kubernetes",
-                    "AWS",
-                    "Azure",
-                    "Machine Learning",
-                    "Data Science",
-                    "DevOps",
-                    "Cybersecurity",
-                    "Web Development",
-                    "Mobile Development",
-                    "Game Development",
-                    "Blockchain",
-                    "Cloud Computing",
-                ],
-            )
+            technology = st.selectbox("Technology", _TECHNOLOGIES)
 
         # Return form data if required fields are filled
         if test_name and technology:
@@ -1,8 +1,20 @@
 # Pages package
-from .test_generation import show_test_generation_page
-from .test_list import show_question_list_page
+# Page modules are imported on first access so that importing one page does not
+# pull in the dependencies of the other.
+import importlib
+
+_EXPORTS = {
+    'show_test_generation_page': '.test_generation',
+    'show_question_list_page': '.test_list',
+}
 
 __all__ = [
     'show_test_generation_page',
     'show_question_list_page'
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,67 @@
 import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
 from components.test_form import TestForm
-from services.test_generation_service import TestGenerationService
+from .test_list import load_all_tests, compute_analytics, get_test_service
 import os
+from collections import defaultdict
+
+# Shared worker pool so LLM calls do not block the Streamlit script thread
+_EXEC = ThreadPoolExecutor(max_workers=4)
+
+# Improved CSS for card-like appearance and full width
+QUESTION_CARD_CSS = """
+<style>
+.question-card {
+    background: #fff;
+    border-radius: 10px;
+    box-shadow: 0 4px 16px rgba(0,0,0,0.07);
+    border: 1.5px solid #e0e0e0;
+    padding: 2em 2em 1.5em 2em;
+    margin-bottom: 2em;
+    width: 100%;
+    min-width: 0;
+    max-width: 100%;
+    box-sizing: border-box;
+}
+.question-title {
+    font-weight: bold;
+    font-size: 1.15em;
+    margin-bottom: 0.7em;
+}
+.option-list {
+    margin-left: 1.2em;
+    margin-bottom: 0.7em;
+}
+.meta {
+    color: #888;
+    font-size: 0.98em;
+    margin-top: 0.7em;
+}
+</style>
+"""
+
+# One preview card; unindented so markdown never treats it as a code block
+QUESTION_CARD_TEMPLATE = (
+    '<div class="question-card">'
+    '<div class="question-title">Question {number}: {question}</div>'
+    '<div><b>Options:</b></div>'
+    '<div class="option-list">'
+    '<div>a. {a}</div>'
+    '<div>b. {b}</div>'
+    '<div>c. {c}</div>'
+    '<div>d. {d}</div>'
+    '</div>'
+    '<div class="meta"><b>Difficulty:</b> {difficulty} &nbsp; | &nbsp; <b>Technology:</b> {technology}</div>'
+    '</div>'
+)
+
+# Placeholder values for fields a generated question may lack
+_CARD_DEFAULTS = {"question": "No question text", "difficulty": "N/A", "technology": "N/A"}
+
+@st.cache_resource
+def get_test_form():
+    """Return a single TestForm shared across reruns."""
+    return TestForm()
 
 def show_test_generation_page():
     """Display the test generation page with a 2x2 grid layout."""
@@ -9,169 +69,167 @@ def show_test_generation_page():
     st.markdown("---")
 
     # Initialize question service
-    question_service = TestGenerationService()
+    question_service = get_test_service()
 
     # Initialize session state for generated test and progress
-    if 'generated_test' not in st.session_state:
-        st.session_state.generated_test = None
-    if 'current_form_data' not in st.session_state:
-        st.session_state.current_form_data = None
-    if 'is_generating_test' not in st.session_state:
-        st.session_state.is_generating_test = False
+    st.session_state.setdefault('generated_test', None)
+    st.session_state.setdefault('current_form_data', None)
+    st.session_state.setdefault('is_generating_test', False)
+
+    # Poll a running background generation, if any
+    if st.session_state.get('_gen_future') is not None:
+        _generation_status()
 
     # Create two main columns: left (form+diagram), right (question paper)
     col_left, col_right = st.columns([1, 2], gap="large")
 
     with col_left:
-        # First row: Test Form
-        with st.container():
-            test_form = TestForm()
-            form_data = test_form.render()
-
-            # Generate questions button (disabled if form is not valid)
-            generate_btn_disabled = form_data is None or st.session_state.is_generating_test
-            if st.button("🚀 Generate Test", type="primary", use_container_width=True, key="generate_test_btn", disabled=generate_btn_disabled):
-                if form_data:
-                    # Merge form data with settings
-                    generation_params = {
-                        'test_name': form_data['test_name'],
-                        'num_questions': form_data['num_questions'],
-                        'difficulty': form_data['difficulty'],
-                        'technology': form_data['technology'],
-                    }
-                    st.session_state.current_form_data = form_data
-                    st.session_state.is_generating_test = True
-
-                    # Show loading state
-                    with st.spinner("Generating test..."):
-                        try:
-                            # Generate questions using the service
-                            test = question_service.generate_test(generation_params)
-                            print(test)
-
-                            # Store in session state
-                            st.session_state.generated_test = test
-                            st.session_state.current_form_data = form_data  # Save form data for later use
-
-                            # Automatically save the test
-                            test_name = form_data.get('test_name', 'Untitled')
-                            question_set_id = question_service.save_test(test, test_name)
-                            
-                            # Show success toast message
-                            st.success(f"✅ Test generated and saved successfully!")
-                            st.info(f"📁 Saved as: {test_name} (ID: {question_set_id})")
-                            st.info("💡 You can view your saved test in the 'List of Tests' page.")
-
-                            st.session_state.is_generating_test = False
-                            st.rerun()
-
-                        except Exception as e:
-                            st.session_state.is_generating_test = False
-                            st.error(f"Error generating test: {str(e)}")
-
-            # Generate new test button (only if a test is generated)
-            if st.session_state.generated_test:
-                st.markdown("---")
-                if st.button("🔄 Generate New Test", use_container_width=True, key="generate_new_btn"):
-                    st.session_state.generated_test = None
-                    st.session_state.current_form_data = None
-                    st.rerun()
-
-        # Second row: Diagram
-        with st.container():
-            st.subheader("🗺️ Workflow Diagram")
-            png_path = os.path.join(os.path.dirname(__file__), "../services/workflow_graph.png")
-            if os.path.exists(png_path):
-                st.markdown(
-                    f"""
-                    <div style='display: flex; justify-content: center; align-items: center; width: 100%;'>
-                        <img src='data:image/png;base64,{get_base64_image(png_path)}' style='max-height: 500px; height: auto; display: block; margin: 0 auto;'/>
-                    </div>
-                    """,
-                    unsafe_allow_html=True
-                )
-            else:
-                st.info("Workflow PNG diagram not found. Please generate it first using the export-graph-png command.")
+        _left_fragment(question_service)
 
     with col_right:
-        # This column spans both rows: Question Paper Preview
-        if st.session_state.is_generating_test:
-            st.subheader("📋 Generated Test Preview")
+        _right_fragment()
+
+def _generate_and_save(question_service, generation_params):
+    """Generate and save a test; runs on a worker thread and must not touch st.session_state."""
+    # generation_params is passed through unchanged: the workflow fans out one LLM
+    # call per question concurrently and retries duplicates or failures in extra
+    # rounds (the single batched call is only used with use_graph=True).
+    test = question_service.generate_test(generation_params)
+    test_name = generation_params.get('test_name', 'Untitled')
+    question_set_id = question_service.save_test(test, test_name)
+    return test, test_name, question_set_id
+
+@st.fragment(run_every=1)
+def _generation_status():
+    """Show progress while the background generation runs and collect its result once done."""
+    future = st.session_state._gen_future
+    if not future.done():
+        st.status("Generating test...", state="running")
+        return
+    st.session_state._gen_future = None
+    st.session_state.is_generating_test = False
+    try:
+        test, test_name, question_set_id = future.result()
+
+        # Store in session state
+        st.session_state.generated_test = test
+        st.session_state.generated_test_html = build_generated_test_html(test)
+        load_all_tests.clear()
+        compute_analytics.clear()
+
+        # Show success toast message
+        st.toast(f"✅ Test generated and saved as {test_name} (ID: {question_set_id})")
+    except Exception as e:
+        st.session_state._gen_error = str(e)
+    st.rerun()
+
+@st.fragment
+def _left_fragment(question_service):
+    """Form and workflow diagram; widget interactions here only rerun this fragment."""
+    # First row: Test Form
+    with st.container():
+        test_form = get_test_form()
+        form_data = test_form.render()
+
+        # Generate questions button (disabled if form is not valid)
+        generate_btn_disabled = form_data is None or st.session_state.is_generating_test
+        if st.button("🚀 Generate Test", type="primary", use_container_width=True, key="generate_test_btn", disabled=generate_btn_disabled):
+            if form_data:
+                # Merge form data with settings
+                generation_params = {
+                    'test_name': form_data['test_name'],
+                    'num_questions': form_data['num_questions'],
+                    'difficulty': form_data['difficulty'],
+                    'technology': form_data['technology'],
+                }
+                st.session_state.current_form_data = form_data
+                st.session_state.is_generating_test = True
+
+                # Generate and save in the background; _generation_status polls the result
+                st.session_state._gen_future = _EXEC.submit(_generate_and_save, question_service, generation_params)
+                st.rerun()
+
+        # Surface the outcome of a finished background generation
+        gen_error = st.session_state.pop('_gen_error', None)
+        if gen_error:
+            st.error(f"Error generating test: {gen_error}")
+
+        # Generate new test button (only if a test is generated)
+        if st.session_state.generated_test:
+            st.markdown("---")
+            if st.button("🔄 Generate New Test", use_container_width=True, key="generate_new_btn"):
+                st.session_state.generated_test = None
+                st.session_state.generated_test_html = None
+                st.session_state.current_form_data = None
+                st.rerun()
+
+    # Second row: Diagram
+    with st.container():
+        st.subheader("🗺️ Workflow Diagram")
+        png_path = os.path.join(os.path.dirname(__file__), "../services/workflow_graph.png")
+        if os.path.exists(png_path):
             st.markdown(
-                """
-                <div style='display: flex; flex-direction: column; align-items: center; justify-content: center; height: 300px;'>
-                    <div style='font-size: 3em;'>⏳</div>
-                    <div style='font-size: 1.2em; margin-top: 1em;'>Generating your test... Please wait!</div>
-                </div>
-                """,
+                get_workflow_diagram_html(png_path, os.path.getmtime(png_path)),
                 unsafe_allow_html=True
             )
-        elif st.session_state.generated_test:
-            display_generated_test(st.session_state.generated_test)
         else:
-            st.subheader("📋 Generated Test Preview")
-            st.info("No test generated yet. Fill the form and click 'Generate Test' to preview your test here.")
+            st.info("Workflow PNG diagram not found. Please generate it first using the export-graph-png command.")
+
+@st.fragment
+def _right_fragment():
+    """Generated test preview, rendered independently of the form fragment."""
+    # This column spans both rows: Question Paper Preview
+    if st.session_state.is_generating_test:
+        st.subheader("📋 Generated Test Preview")
+        st.markdown(
+            """
+            <div style='display: flex; flex-direction: column; align-items: center; justify-content: center; height: 300px;'>
+                <div style='font-size: 3em;'>⏳</div>
+                <div style='font-size: 1.2em; margin-top: 1em;'>Generating your test... Please wait!</div>
+            </div>
+            """,
+            unsafe_allow_html=True
+        )
+    elif st.session_state.generated_test:
+        display_generated_test(st.session_state.generated_test)
+    else:
+        st.subheader("📋 Generated Test Preview")
+        st.info("No test generated yet. Fill the form and click 'Generate Test' to preview your test here.")
 
 def display_generated_test(test):
     """Display the generated test in a clean preview format without answers, using full width and improved visibility."""
     st.subheader("📋 Generated Test Preview")
 
-    # Improved CSS for card-like appearance and full width
-    st.markdown(
-        """
-        <style>
-        .question-card {
-            background: #fff;
-            border-radius: 10px;
-            box-shadow: 0 4px 16px rgba(0,0,0,0.07);
-            border: 1.5px solid #e0e0e0;
-            padding: 2em 2em 1.5em 2em;
-            margin-bottom: 2em;
-            width: 100%;
-            min-width: 0;
-            max-width: 100%;
-            box-sizing: border-box;
-        }
-        .question-title {
-            font-weight: bold;
-            font-size: 1.15em;
-            margin-bottom: 0.7em;
-        }
-        .option-list {
-            margin-left: 1.2em;
-            margin-bottom: 0.7em;
-        }
-        .meta {
-            color: #888;
-            font-size: 0.98em;
-            margin-top: 0.7em;
-        }
-        </style>
-        """,
-        unsafe_allow_html=True
-    )
+    # The preview HTML is built once when the test is generated and reused on every rerun
+    html = st.session_state.get('generated_test_html')
+    if html is None:
+        html = st.session_state.generated_test_html = build_generated_test_html(test)
+    st.markdown(html, unsafe_allow_html=True)
 
+def build_generated_test_html(test):
+    """Build the preview HTML (styles plus one card per question) for a generated test."""
+    cards = []
     for i, question in enumerate(test, 1):
-        options = question.get('options', {})
-        with st.container():
-            st.markdown(
-                f"""
-                <div class="question-card">
-                    <div class="question-title">Question {i}: {question.get('question', 'No question text')}</div>
-                    <div><b>Options:</b></div>
-                    <div class="option-list">
-                        <div>a. {options.get('a', '')}</div>
-                        <div>b. {options.get('b', '')}</div>
-                        <div>c. {options.get('c', '')}</div>
-                        <div>d. {options.get('d', '')}</div>
-                    </div>
-                    <div class="meta"><b>Difficulty:</b> {question.get('difficulty', 'N/A')} &nbsp; | &nbsp; <b>Technology:</b> {question.get('technology', 'N/A')}</div>
-                </div>
-                """,
-                unsafe_allow_html=True
-            )
-
-def get_base64_image(image_path):
+        # Missing option letters render empty, as options.get(k, "") did
+        fields = defaultdict(str, _CARD_DEFAULTS)
+        fields.update(question)
+        fields.update(question.get('options', {}))
+        fields['number'] = i
+        cards.append(QUESTION_CARD_TEMPLATE.format_map(fields))
+    # Styles and all cards go out as a single element
+    return QUESTION_CARD_CSS + "".join(cards)
+
+@st.cache_data(show_spinner=False)
+def get_base64_image(image_path, mtime):
     import base64
     with open(image_path, "rb") as img_file:
-        return base64.b64encode(img_file.read()).decode() 
\ No newline at end of file
+        return base64.b64encode(img_file.read()).decode()
+
+@st.cache_data(show_spinner=False)
+def get_workflow_diagram_html(image_path, mtime):
+    """Build the centered <img> block for the workflow PNG; cached per file mtime."""
+    return f"""
+    <div style='display: flex; justify-content: center; align-items: center; width: 100%;'>
+        <img src='data:image/png;base64,{get_base64_image(image_path, mtime)}' style='max-height: 500px; height: auto; display: block; margin: 0 auto;'/>
+    </div>
+    """ 
\ No newline at end of file
@@ -1,6 +1,32 @@
 import streamlit as st
 from services.test_generation_service import TestGenerationService
 from components.question_list_view import QuestionListView
+from workflow.test_generation_workflow import get_workflow
+
+@st.cache_resource
+def get_test_service():
+    """Return a single TestGenerationService shared across reruns and pages."""
+    return TestGenerationService(get_workflow())
+
+@st.cache_resource
+def get_list_view():
+    """Return a single stateless QuestionListView shared across reruns."""
+    return QuestionListView()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_all_tests(fingerprint):
+    """Load all test sets once per storage fingerprint (test file count + latest mtime)."""
+    return tuple(get_test_service().get_all_tests())
+
+@st.cache_data(show_spinner=False)
+def get_supported_technologies():
+    """Technology filter options; static for the lifetime of the process."""
+    return get_test_service().get_supported_technologies()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def compute_analytics(fingerprint):
+    """Aggregate analytics once per storage fingerprint (test file count + latest mtime)."""
+    return get_test_service().get_analytics()
 
 def show_test_list_page():
     """Display the test list page."""
@@ -8,8 +34,8 @@ def show_test_list_page():
     st.markdown("---")
     
     # Initialize test service and list view
-    test_service = TestGenerationService()
-    list_view = QuestionListView()
+    test_service = get_test_service()
+    list_view = get_list_view()
     
     # Create tabs for different views
     tab1, tab2, tab3 = st.tabs(["📊 All Tests", "🔍 Search & Filter", "📈 Analytics"])
@@ -28,26 +54,25 @@ def show_all_tests(test_service, list_view):
     """Display all test sets in a list view."""
     st.subheader("📊 All Tests")
 
-    # Get all test sets
-    test_sets = test_service.get_all_tests()
-
-    if not test_sets:
-        st.info("No tests found. Generate some tests first!")
-        return
-
     selected_test_id = st.session_state.get('selected_test_id', None)
     if selected_test_id:
-        # Find the selected test set
-        test_set = next((t for t in test_sets if t.get('id', '') == selected_test_id), None)
+        # Load only the selected test set instead of scanning the full list
+        test_set = test_service.get_test_set(selected_test_id)
         if test_set:
             list_view.render_interactive_test_page(test_set)
         else:
             st.error("Selected test not found.")
         return
 
-    # Display test sets using the list view component
-    for test_set in test_sets:
-        list_view.render_question_set(test_set)
+    # Get all test sets (cached until the stored tests change)
+    test_sets = load_all_tests(test_service.get_tests_fingerprint())
+
+    if not test_sets:
+        st.info("No tests found. Generate some tests first!")
+        return
+
+    # Display test sets using the paginated list view component
+    list_view.render_paginated(test_sets)
 
 def show_search_filter(test_service, list_view):
     """Display search and filter interface for tests."""
@@ -58,7 +83,7 @@ def show_search_filter(test_service, list_view):
     
     with col1:
         search_term = st.text_input("Search questions", placeholder="Enter keywords...")
-        tech_options = ["All"] + test_service.get_supported_technologies()
+        tech_options = ["All", *get_supported_technologies()]
         technology_filter = st.selectbox("Filter by Technology", tech_options)
     
     with col2:
@@ -78,7 +103,7 @@ def show_search_filter(test_service, list_view):
 def show_analytics(test_service, list_view):
     """Display analytics and statistics for tests."""
     st.subheader("📈 Analytics")
-    analytics = test_service.get_analytics()
+    analytics = compute_analytics(test_service.get_tests_fingerprint())
     list_view.render_analytics(analytics)
 
 # For backward compatibility with app.py
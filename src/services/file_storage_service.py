@@ -1,10 +1,52 @@
+import hashlib
 import json
 import os
-from datetime import datetime
+import sqlite3
+import threading
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 import uuid
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_dumps(obj: Any, indent: bool = True) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+# Fields kept in the tests index; question bodies live only in the per-set files
+INDEX_FIELDS = ('id', 'title', 'created_date', 'total_tests', 'metadata')
+
+# Option labels used by the text export
+LETTERS = ('A', 'B', 'C', 'D', 'E', 'F', 'G', 'H')
+
+
+def _json_loads(data: Any) -> Any:
+    """Parse JSON from bytes or str, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _atomic_write(path: Path, data: bytes):
+    """Write bytes to a temp file next to path and rename it into place."""
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+# Serializes index and log mutations across Streamlit session threads
+_STORAGE_LOCK = threading.RLock()
+
+
 class FileStorageService:
     """Service for managing file-based storage operations."""
     
@@ -14,6 +56,18 @@ class FileStorageService:
         self.settings_dir = self.base_dir / "settings"
         self.exports_dir = self.base_dir / "exports"
         self.logs_dir = self.base_dir / "logs"
+        self.db_file = self.base_dir / "tests.db"
+        
+        # SQLite connection for the tests index, opened on first use
+        self._conn: Optional[sqlite3.Connection] = None
+        
+        # In-memory copy of the tests index, keyed by id in listing order. It is
+        # reloaded when another connection commits (PRAGMA data_version changes).
+        self._index_cache: Optional[Dict[str, Dict[str, Any]]] = None
+        self._index_version: Optional[int] = None
+        
+        # Digest of the last settings written per user, to skip unchanged saves
+        self._settings_hash: Dict[str, bytes] = {}
         
         # Create directories if they don't exist
         self._create_directories()
@@ -24,9 +78,77 @@ class FileStorageService:
             directory.mkdir(parents=True, exist_ok=True)
     
     def _get_tests_file(self) -> Path:
-        """Get the tests storage file path."""
+        """Get the legacy JSON tests index path (migrated into SQLite on first use)."""
         return self.tests_dir / "tests.json"
     
+    def _get_connection(self) -> sqlite3.Connection:
+        """Open the tests index database on first use and migrate the legacy JSON index."""
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_file, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS tests ("
+                "id TEXT PRIMARY KEY, title TEXT, created_date TEXT, total_tests INTEGER, "
+                "metadata_json TEXT)"
+            )
+            self._drop_payload_column(conn)
+            self._conn = conn
+            self._migrate_json_index()
+        return self._conn
+    
+    def _drop_payload_column(self, conn: sqlite3.Connection):
+        """One-time migration: rebuild an older index table without its full-payload column."""
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(tests)")]
+        if "payload_json" not in columns:
+            return
+        # Copy into a fresh table rather than ALTER ... DROP COLUMN, which needs SQLite 3.35+
+        with conn:
+            conn.execute("BEGIN")
+            conn.execute(
+                "CREATE TABLE tests_slim ("
+                "id TEXT PRIMARY KEY, title TEXT, created_date TEXT, total_tests INTEGER, "
+                "metadata_json TEXT)"
+            )
+            conn.execute(
+                "INSERT INTO tests_slim (rowid, id, title, created_date, total_tests, metadata_json) "
+                "SELECT rowid, id, title, created_date, total_tests, metadata_json FROM tests"
+            )
+            conn.execute("DROP TABLE tests")
+            conn.execute("ALTER TABLE tests_slim RENAME TO tests")
+    
+    def _migrate_json_index(self):
+        """Ingest an existing tests.json index once, then move it aside."""
+        tests_file = self._get_tests_file()
+        if not tests_file.exists():
+            return
+        try:
+            self._save_tests_index(_json_loads(tests_file.read_bytes()))
+            tests_file.replace(tests_file.with_suffix(".json.migrated"))
+            self._log_operation("migrate_tests_index", {"source": str(tests_file)})
+        except Exception as e:
+            self._log_error("_migrate_json_index", str(e))
+    
+    def _index_entry(self, test_set: Dict[str, Any]) -> Dict[str, Any]:
+        """Project a full test set onto the slim index fields."""
+        entry = {k: test_set.get(k) for k in INDEX_FIELDS}
+        if not isinstance(entry['total_tests'], int):
+            entry['total_tests'] = len(test_set.get('tests', []))
+        if entry['metadata'] is None:
+            entry['metadata'] = {}
+        return entry
+    
+    def _index_row(self, test_set: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Build the parameter tuple for a tests index row."""
+        entry = self._index_entry(test_set)
+        return (
+            entry['id'],
+            entry['title'],
+            entry['created_date'],
+            entry['total_tests'],
+            _json_dumps(entry['metadata'], indent=False).decode(),
+        )
+    
     def _get_settings_file(self) -> Path:
         """Get the settings storage file path."""
         return self.settings_dir / "app_settings.json"
@@ -43,83 +165,122 @@ class FileStorageService:
         """Get export file path."""
         return self.exports_dir / filename
     
-    def _get_log_file(self) -> Path:
-        """Get log file path."""
-        timestamp = datetime.now().strftime("%Y-%m-%d")
-        return self.logs_dir / f"app_log_{timestamp}.json"
+    def _get_log_file(self, date: Optional[str] = None) -> Path:
+        """Get the JSON-Lines log file path for a YYYY-MM-DD date (defaults to today)."""
+        timestamp = date or datetime.now().strftime("%Y-%m-%d")
+        return self.logs_dir / f"app_log_{timestamp}.jsonl"
     
     def save_tests(self, tests: List[Dict[str, Any]], test_name: str) -> str:
         """Save tests to file system."""
         try:
-            # Validate input
-            if not tests:
-                raise ValueError("No tests provided to save")
-            
-            if not test_name or not test_name.strip():
-                test_name = "Untitled Test"
-            
-            # Generate unique ID for the test set
-            test_set_id = str(uuid.uuid4())
-            
-            # Create test set data
-            test_set = {
-                'id': test_set_id,
-                'title': test_name,
-                'tests': tests,
-                'created_date': datetime.now().isoformat(),
-                'total_tests': len(tests),
-                'metadata': {
-                    'technology': tests[0].get('technology', 'Unknown') if tests else 'Unknown',
-                    'test_name': tests[0].get('test_name', 'Unknown') if tests else 'Unknown',
-                    'difficulty': tests[0].get('difficulty', 'Unknown') if tests else 'Unknown'
+            with _STORAGE_LOCK:
+                # Validate input
+                if not tests:
+                    raise ValueError("No tests provided to save")
+                
+                if not test_name or not test_name.strip():
+                    test_name = "Untitled Test"
+                
+                # Generate unique ID for the test set
+                test_set_id = str(uuid.uuid4())
+                
+                # Create test set data
+                test_set = {
+                    'id': test_set_id,
+                    'title': test_name,
+                    'tests': tests,
+                    'created_date': datetime.now().isoformat(),
+                    'total_tests': len(tests),
+                    'metadata': {
+                        'technology': tests[0].get('technology', 'Unknown') if tests else 'Unknown',
+                        'test_name': tests[0].get('test_name', 'Unknown') if tests else 'Unknown',
+                        'difficulty': tests[0].get('difficulty', 'Unknown') if tests else 'Unknown'
+                    }
                 }
-            }
-            
-            # Ensure tests directory exists
-            self.tests_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Save to individual file
-            test_set_file = self._get_test_set_file(test_set_id)
-            with open(test_set_file, 'w', encoding='utf-8') as f:
-                json.dump(test_set, f, indent=2, ensure_ascii=False)
-            
-            # Update main tests index
-            self._update_tests_index(test_set)
-            
-            # Log the operation
-            self._log_operation("save_tests", {
-                "test_set_id": test_set_id,
-                "test_name": test_name,
-                "test_count": len(tests),
-                "file_path": str(test_set_file)
-            })
-            
-            return test_set_id
+                
+                # Save to individual file
+                test_set_file = self._get_test_set_file(test_set_id)
+                _atomic_write(test_set_file, _json_dumps(test_set))
+                
+                # Update main tests index
+                self._update_tests_index(test_set)
+                
+                # Log the operation
+                self._log_operation("save_tests", {
+                    "test_set_id": test_set_id,
+                    "test_name": test_name,
+                    "test_count": len(tests),
+                    "file_path": str(test_set_file)
+                })
+                
+                return test_set_id
             
         except Exception as e:
             error_msg = f"Error saving tests: {str(e)}"
             self._log_error("save_tests", error_msg)
             raise Exception(error_msg)
     
+    def _normalize_test_set(self, test_set: Dict[str, Any]) -> Dict[str, Any]:
+        """Guarantee the test set carries an integer total_tests field."""
+        if not isinstance(test_set.get('total_tests'), int):
+            test_set['total_tests'] = len(test_set.get('tests', []))
+        return test_set
+    
     def load_tests(self) -> List[Dict[str, Any]]:
-        """Load all tests from file system."""
+        """Load the index entries (INDEX_FIELDS only, no questions) of all test sets."""
         try:
-            tests_file = self._get_tests_file()
-            if tests_file.exists():
-                with open(tests_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            return []
+            with _STORAGE_LOCK:
+                conn = self._get_connection()
+                version = conn.execute("PRAGMA data_version").fetchone()[0]
+                if self._index_cache is None or version != self._index_version:
+                    rows = conn.execute(
+                        "SELECT id, title, created_date, total_tests, metadata_json FROM tests ORDER BY rowid"
+                    ).fetchall()
+                    cache = {}
+                    for test_set_id, title, created_date, total_tests, metadata_json in rows:
+                        cache[test_set_id] = {
+                            'id': test_set_id,
+                            'title': title,
+                            'created_date': created_date,
+                            'total_tests': total_tests or 0,
+                            'metadata': _json_loads(metadata_json) if metadata_json else {},
+                        }
+                    self._index_cache = cache
+                    self._index_version = version
+                return list(self._index_cache.values())
         except Exception as e:
             self._log_error("load_tests", str(e))
             return []
     
+    def load_test_sets(self) -> List[Dict[str, Any]]:
+        """Load every full test set (with questions) from its file, in index order."""
+        test_sets = []
+        for entry in self.load_tests():
+            test_set = self.get_test_set(entry['id'])
+            if test_set:
+                test_sets.append(test_set)
+        return test_sets
+    
+    def get_tests_fingerprint(self) -> Tuple[int, float]:
+        """Get a cheap (file count, latest mtime) fingerprint of the stored test files."""
+        count = 0
+        latest_mtime = 0.0
+        try:
+            with os.scandir(self.tests_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".json") and entry.is_file():
+                        count += 1
+                        latest_mtime = max(latest_mtime, entry.stat().st_mtime)
+        except Exception as e:
+            self._log_error("get_tests_fingerprint", str(e))
+        return count, latest_mtime
+    
     def get_test_set(self, test_set_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific test set by ID."""
         try:
             test_set_file = self._get_test_set_file(test_set_id)
             if test_set_file.exists():
-                with open(test_set_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return self._normalize_test_set(_json_loads(test_set_file.read_bytes()))
             return None
         except Exception as e:
             self._log_error("get_test_set", str(e))
@@ -128,51 +289,53 @@ class FileStorageService:
     def delete_test_set(self, test_set_id: str) -> bool:
         """Delete a test set."""
         try:
-            # Remove individual file
-            test_set_file = self._get_test_set_file(test_set_id)
-            if test_set_file.exists():
-                test_set_file.unlink()
-            
-            # Update main index
-            tests = self.load_tests()
-            tests = [ts for ts in tests if ts.get('id') != test_set_id]
-            self._save_tests_index(tests)
-            
-            # Log the operation
-            self._log_operation("delete_test_set", {
-                "test_set_id": test_set_id
-            })
-            
-            return True
-        except Exception as e:
-            self._log_error("delete_test_set", str(e))
-            return False
-    
-    def update_test_set(self, test_set_id: str, updated_data: Dict[str, Any]) -> bool:
-        """Update a test set."""
-        try:
-            test_set_file = self._get_test_set_file(test_set_id)
-            if test_set_file.exists():
-                with open(test_set_file, 'r', encoding='utf-8') as f:
-                    test_set = json.load(f)
-                
-                # Update the data
-                test_set.update(updated_data)
-                
-                # Save back to file
-                with open(test_set_file, 'w', encoding='utf-8') as f:
-                    json.dump(test_set, f, indent=2, ensure_ascii=False)
+            with _STORAGE_LOCK:
+                # Remove individual file
+                test_set_file = self._get_test_set_file(test_set_id)
+                if test_set_file.exists():
+                    test_set_file.unlink()
                 
                 # Update main index
-                self._update_tests_index(test_set)
+                self._get_connection().execute("DELETE FROM tests WHERE id = ?", (test_set_id,))
+                if self._index_cache is not None:
+                    self._index_cache.pop(test_set_id, None)
                 
                 # Log the operation
-                self._log_operation("update_test_set", {
+                self._log_operation("delete_test_set", {
                     "test_set_id": test_set_id
                 })
                 
                 return True
+        except Exception as e:
+            self._log_error("delete_test_set", str(e))
             return False
+    
+    def update_test_set(self, test_set_id: str, updated_data: Dict[str, Any]) -> bool:
+        """Update a test set."""
+        try:
+            with _STORAGE_LOCK:
+                test_set_file = self._get_test_set_file(test_set_id)
+                if test_set_file.exists():
+                    test_set = _json_loads(test_set_file.read_bytes())
+                    
+                    # Update the data, keeping total_tests in step with the questions
+                    test_set.update(updated_data)
+                    if 'tests' in updated_data:
+                        test_set['total_tests'] = len(test_set['tests'])
+                    
+                    # Save back to file
+                    _atomic_write(test_set_file, _json_dumps(test_set))
+                    
+                    # Update main index
+                    self._update_tests_index(test_set)
+                    
+                    # Log the operation
+                    self._log_operation("update_test_set", {
+                        "test_set_id": test_set_id
+                    })
+                    
+                    return True
+                return False
         except Exception as e:
             self._log_error("update_test_set", str(e))
             return False
@@ -181,12 +344,13 @@ class FileStorageService:
         """Save user settings."""
         try:
             settings_file = self._get_user_settings_file(user_id)
+            data = _json_dumps(settings)
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            if self._settings_hash.get(user_id) == digest and settings_file.exists():
+                return True
             
-            # Ensure directory exists
-            settings_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(settings_file, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=2, ensure_ascii=False)
+            _atomic_write(settings_file, data)
+            self._settings_hash[user_id] = digest
             
             # Log the operation
             self._log_operation("save_settings", {
@@ -204,8 +368,7 @@ class FileStorageService:
         try:
             settings_file = self._get_user_settings_file(user_id)
             if settings_file.exists():
-                with open(settings_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return _json_loads(settings_file.read_bytes())
             return {}
         except Exception as e:
             self._log_error("load_settings", str(e))
@@ -225,8 +388,7 @@ class FileStorageService:
             export_file = self._get_export_file(filename)
             
             if format == "json":
-                with open(export_file, 'w', encoding='utf-8') as f:
-                    json.dump(test_set, f, indent=2, ensure_ascii=False)
+                _atomic_write(export_file, _json_dumps(test_set))
             elif format == "txt":
                 self._export_to_txt(test_set, export_file)
             else:
@@ -246,37 +408,43 @@ class FileStorageService:
     
     def _export_to_txt(self, test_set: Dict[str, Any], file_path: Path):
         """Export tests to text format."""
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(f"Test: {test_set.get('title', 'Untitled')}\n")
-            f.write(f"Created: {test_set.get('created_date', 'Unknown')}\n")
-            f.write(f"Total Tests: {test_set.get('total_tests', 0)}\n")
-            f.write("=" * 50 + "\n\n")
+        parts = [
+            f"Test: {test_set.get('title', 'Untitled')}\n",
+            f"Created: {test_set.get('created_date', 'Unknown')}\n",
+            f"Total Tests: {test_set.get('total_tests', 0)}\n",
+            "=" * 50 + "\n\n",
+        ]
+        
+        for i, test in enumerate(test_set.get('tests', []), 1):
+            parts.append(f"Test {i}:\n")
+            parts.append(f"{test.get('test', '')}\n\n")
             
-            for i, test in enumerate(test_set.get('tests', []), 1):
-                f.write(f"Test {i}:\n")
-                f.write(f"{test.get('test', '')}\n\n")
-                
-                options = test.get('options', [])
-                for j, option in enumerate(options):
-                    f.write(f"{chr(65+j)}. {option}\n")
-                
-                f.write(f"\nCorrect Answer: {test.get('correct_answer', '')}\n")
-                f.write(f"Explanation: {test.get('explanation', '')}\n")
-                f.write("-" * 30 + "\n\n")
+            options = test.get('options', [])
+            parts.append("".join(f"{LETTERS[j]}. {option}\n" for j, option in enumerate(options)))
+            
+            parts.append(f"\nCorrect Answer: {test.get('correct_answer', '')}\n")
+            parts.append(f"Explanation: {test.get('explanation', '')}\n")
+            parts.append("-" * 30 + "\n\n")
+        
+        # Build the whole export in memory and write it once
+        _atomic_write(file_path, "".join(parts).encode('utf-8'))
     
     def _update_tests_index(self, test_set: Dict[str, Any]):
         """Update the main tests index."""
         try:
-            tests = self.load_tests()
-            
-            # Remove existing entry if it exists
-            tests = [ts for ts in tests if ts.get('id') != test_set.get('id')]
-            
-            # Add new/updated entry
-            tests.append(test_set)
-            
-            # Save updated index
-            self._save_tests_index(tests)
+            with _STORAGE_LOCK:
+                # Replacing the row also moves an updated test set to the end of the listing
+                self._get_connection().execute(
+                    "INSERT OR REPLACE INTO tests "
+                    "(id, title, created_date, total_tests, metadata_json) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    self._index_row(test_set),
+                )
+                
+                # Mirror the write in the cache, moving the entry to the end like the row
+                if self._index_cache is not None:
+                    self._index_cache.pop(test_set.get('id'), None)
+                    self._index_cache[test_set.get('id')] = self._index_entry(test_set)
             
         except Exception as e:
             error_msg = f"Error updating tests index: {str(e)}"
@@ -284,15 +452,20 @@ class FileStorageService:
             raise Exception(error_msg)
     
     def _save_tests_index(self, tests: List[Dict[str, Any]]):
-        """Save the tests index."""
+        """Replace the whole tests index in a single transaction."""
         try:
-            tests_file = self._get_tests_file()
-            
-            # Ensure directory exists
-            tests_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(tests_file, 'w', encoding='utf-8') as f:
-                json.dump(tests, f, indent=2, ensure_ascii=False)
+            with _STORAGE_LOCK:
+                conn = self._get_connection()
+                with conn:
+                    conn.execute("BEGIN")
+                    conn.execute("DELETE FROM tests")
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO tests "
+                        "(id, title, created_date, total_tests, metadata_json) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        [self._index_row(ts) for ts in tests],
+                    )
+                self._index_cache = {ts.get('id'): self._index_entry(ts) for ts in tests}
             
         except Exception as e:
             error_msg = f"Error saving tests index: {str(e)}"
@@ -302,26 +475,37 @@ class FileStorageService:
     def _log_operation(self, operation: str, data: Dict[str, Any]):
         """Log an operation."""
         try:
-            log_file = self._get_log_file()
-            log_entry = {
-                'timestamp': datetime.now().isoformat(),
-                'operation': operation,
-                'data': data
-            }
-            
-            logs = []
-            if log_file.exists():
-                with open(log_file, 'r', encoding='utf-8') as f:
-                    logs = json.load(f)
-            
-            logs.append(log_entry)
-            
-            with open(log_file, 'w', encoding='utf-8') as f:
-                json.dump(logs, f, indent=2, ensure_ascii=False)
+            with _STORAGE_LOCK:
+                log_file = self._get_log_file()
+                log_entry = {
+                    'timestamp': datetime.now().isoformat(),
+                    'operation': operation,
+                    'data': data
+                }
+                
+                # Append one JSON object per line; the existing log is never re-read
+                with open(log_file, 'ab') as f:
+                    f.write(_json_dumps(log_entry, indent=False) + b"\n")
         except Exception:
             # Silently fail if logging fails
             pass
     
+    def read_logs(self, date: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Iterate the log entries for a YYYY-MM-DD date (defaults to today)."""
+        log_file = self._get_log_file(date)
+        if not log_file.exists():
+            return
+        with open(log_file, 'rb') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield _json_loads(line)
+                except ValueError:
+                    # Skip a partially written trailing line
+                    continue
+    
     def _log_error(self, operation: str, error_message: str):
         """Log an error."""
         self._log_operation(f"{operation}_error", {"error": error_message})
@@ -335,7 +519,7 @@ class FileStorageService:
             
             return {
                 'total_test_sets': len(tests),
-                'total_tests': sum(len(ts.get('tests', [])) for ts in tests),
+                'total_tests': sum(ts['total_tests'] for ts in tests),
                 'settings_files': len(settings_files),
                 'export_files': len(export_files),
                 'storage_size': self._get_directory_size(self.base_dir)
@@ -346,10 +530,16 @@ class FileStorageService:
     def _get_directory_size(self, directory: Path) -> int:
         """Get directory size in bytes."""
         total_size = 0
+        pending = [str(directory)]
         try:
-            for file_path in directory.rglob('*'):
-                if file_path.is_file():
-                    total_size += file_path.stat().st_size
+            # scandir entries carry their type, so only regular files are stat'ed
+            while pending:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            total_size += entry.stat(follow_symlinks=False).st_size
         except Exception:
             pass
         return total_size
@@ -357,17 +547,21 @@ class FileStorageService:
     def cleanup_old_files(self, days: int = 30):
         """Clean up old files."""
         try:
-            cutoff_date = datetime.now().timestamp() - (days * 24 * 60 * 60)
+            cutoff = datetime.now() - timedelta(days=days)
+            cutoff_date = cutoff.timestamp()
+            cutoff_str = cutoff.strftime("%Y-%m-%d")
             
-            # Clean up old log files
-            for log_file in self.logs_dir.glob("*.json"):
-                if log_file.stat().st_mtime < cutoff_date:
-                    log_file.unlink()
+            # Clean up old log files; the date is encoded in the name (app_log_YYYY-MM-DD)
+            with os.scandir(self.logs_dir) as entries:
+                for entry in entries:
+                    if entry.name.startswith("app_log_") and entry.name[8:18] < cutoff_str:
+                        os.unlink(entry.path)
             
             # Clean up old export files
-            for export_file in self.exports_dir.glob("*"):
-                if export_file.stat().st_mtime < cutoff_date:
-                    export_file.unlink()
+            with os.scandir(self.exports_dir) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.stat().st_mtime < cutoff_date:
+                        os.unlink(entry.path)
                     
         except Exception as e:
             self._log_error("cleanup_old_files", str(e)) 
\ No newline at end of file
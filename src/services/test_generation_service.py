@@ -1,14 +1,34 @@
-import uuid
+from uuid import uuid4
 import asyncio
-from typing import List, Dict, Any, Optional
+from collections import Counter
+from typing import List, Dict, Any, Optional, Tuple
 from .file_storage_service import FileStorageService
-from workflow.test_generation_workflow import TestGenerationWorkflow
+from workflow.test_generation_workflow import TestGenerationWorkflow, run_on_background_loop
+
+_SUPPORTED_TECHNOLOGIES: Tuple[str, ...] = (
+    "Python", "JavaScript", "Java", "C++", "Ruby", "PHP",
+    "TypeScript", "Go", "Rust", "Swift", "Kotlin", "C#",
+    "React", "Angular", "Vue.js", "Node.js", "Django", "Flask",
+    "Spring Boot", "Express.js", "MongoDB", "PostgreSQL", "MySQL"
+)
+
+_DIFFICULTY_LEVELS: Tuple[str, ...] = ("beginner", "intermediate", "advanced")
 
 class TestGenerationService:
     """Service for managing test generation."""
-    def __init__(self):
+    def __init__(self, test_generation_workflow: Optional[TestGenerationWorkflow] = None):
         self.file_storage = FileStorageService()
-        self.test_generation_workflow = TestGenerationWorkflow()
+        self.test_generation_workflow = test_generation_workflow or TestGenerationWorkflow()
+        # Snapshot of every full test set, reloaded when storage changes
+        self._tests_cache: Optional[List[Dict[str, Any]]] = None
+        self._tests_cache_fingerprint: Optional[Tuple[int, float]] = None
+        # (snapshot, questions, lowercased questions, positions by technology,
+        # positions by difficulty), swapped as one tuple with each new snapshot
+        # so concurrent searches never mix indexes from different snapshots
+        self._search_index: Optional[Tuple[Any, ...]] = None
+        # Last computed analytics, dropped on mutation and when storage changes
+        self._analytics: Optional[Dict[str, Any]] = None
+        self._analytics_fingerprint: Optional[Tuple[int, float]] = None
 
     def generate_test(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Generate test based on the provided parameters using the test generation workflow only."""
@@ -21,113 +41,176 @@ class TestGenerationService:
             errors = result.get('errors', [])
             if errors:
                 print(f"Errors during test generation: {errors}")
-            tests = []
-            for i, q in enumerate(questions, 1):
-                test = {
-                    'id': str(uuid.uuid4()),
-                    'question_number': i,
-                    'question': q['question'],
-                    'options': q['options'],
-                    'answer': q['answer'],
-                    'technology': technology,
-                    'difficulty': difficulty
-                }
-                tests.append(test)
-            return tests
+            return self._format_tests(questions, technology, difficulty)
         except Exception as e:
             print(f"Error in test generation: {str(e)}")
             raise
 
-    def generate_test_async(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Async version of test generation using only the test generation workflow."""
+    async def generate_test_async(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Async version of test generation using only the test generation workflow; await it from a running loop."""
         technology = params.get('technology', 'Python')
         difficulty = params.get('difficulty', 'intermediate')
         num_questions = params.get('num_questions', 5)
         try:
-            result = asyncio.run(self.test_generation_workflow.generate_test(technology, difficulty, num_questions))
+            # Run on the workflow's shared loop, where the Gemini client's async channels live
+            result = await run_on_background_loop(
+                self.test_generation_workflow.generate_test(technology, difficulty, num_questions)
+            )
             questions = result.get('questions', [])
             errors = result.get('errors', [])
             if errors:
                 print(f"Errors during test generation: {errors}")
-            tests = []
-            for i, q in enumerate(questions, 1):
-                test = {
-                    'id': str(uuid.uuid4()),
-                    'question_number': i,
-                    'question': q['question'],
-                    'options': q['options'],
-                    'answer': q['answer'],
-                    'technology': technology,
-                    'difficulty': difficulty
-                }
-                tests.append(test)
-            return tests
+            return self._format_tests(questions, technology, difficulty)
         except Exception as e:
             print(f"Error in async test generation: {str(e)}")
             raise
 
+    def _format_tests(self, questions: List[Dict[str, Any]], technology: str, difficulty: str) -> List[Dict[str, Any]]:
+        """Turn generated workflow questions into numbered test entries."""
+        return [
+            {
+                'id': uuid4().hex,
+                'question_number': i,
+                'question': q['question'],
+                'question_lower': q['question'].lower(),
+                'options': q['options'],
+                'answer': q['answer'],
+                'options_html': q.get('options_html', ''),
+                'technology': technology,
+                'difficulty': difficulty
+            }
+            for i, q in enumerate(questions, 1)
+        ]
+
     def save_test(self, tests: List[Dict[str, Any]], test_name: str) -> str:
         """Save a set of test to storage."""
+        self._invalidate_caches()
         return self.file_storage.save_tests(tests, test_name)
 
     def get_all_tests(self) -> List[Dict[str, Any]]:
-        """Get all test sets."""
+        """Get the index entries of all test sets (use get_test_set for the questions)."""
         return self.file_storage.load_tests()
 
+    def get_tests_fingerprint(self) -> Tuple[int, float]:
+        """Get a fingerprint that changes whenever stored tests change."""
+        return self.file_storage.get_tests_fingerprint()
+
     def get_test_set(self, test_set_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific test set by ID."""
         return self.file_storage.get_test_set(test_set_id)
 
+    def _invalidate_caches(self):
+        """Drop the cached test sets and analytics after a mutation."""
+        self._tests_cache = None
+        self._analytics = None
+
+    def _get_tests_cached(self) -> List[Dict[str, Any]]:
+        """Get all full test sets, reading the per-set files only when storage changed."""
+        fingerprint = self.get_tests_fingerprint()
+        if self._tests_cache is None or fingerprint != self._tests_cache_fingerprint:
+            self._tests_cache = self.file_storage.load_test_sets()
+            self._tests_cache_fingerprint = fingerprint
+        return self._tests_cache
+
+    def _get_search_index(self) -> Tuple[Any, ...]:
+        """Get the flattened question list and its indexes, rebuilt for each new snapshot."""
+        test_sets = self._get_tests_cached()
+        search_index = self._search_index
+        if search_index is None or search_index[0] is not test_sets:
+            questions, q_lower = [], []
+            by_tech: Dict[str, List[int]] = {}
+            by_diff: Dict[str, List[int]] = {}
+            for test_set in test_sets:
+                for test in test_set.get('tests', []):
+                    position = len(questions)
+                    questions.append(test)
+                    # Sets saved before question_lower existed get it filled in on load
+                    question_lower = test.get('question_lower')
+                    if question_lower is None:
+                        question_lower = test['question_lower'] = str(test.get('question', '')).lower()
+                    q_lower.append(question_lower)
+                    by_tech.setdefault(str(test.get('technology', '')).lower(), []).append(position)
+                    by_diff.setdefault(str(test.get('difficulty', '')).lower(), []).append(position)
+            search_index = self._search_index = (test_sets, questions, q_lower, by_tech, by_diff)
+        return search_index
+
     def search_tests(self, search_term: str = None, technology: str = None, difficulty: str = None) -> List[Dict[str, Any]]:
-        """Search tests based on criteria."""
-        all_tests = self.file_storage.load_tests()
-        filtered_tests = []
-        for test_set in all_tests:
-            for test in test_set.get('tests', []):
-                if technology and test.get('technology') != technology:
-                    continue
-                if difficulty and test.get('difficulty') != difficulty:
-                    continue
-                if search_term:
-                    search_lower = search_term.lower()
-                    test_text = test.get('question', '').lower()
-                    if search_lower not in test_text:
-                        continue
-                filtered_tests.append(test)
-        return filtered_tests
+        """Search tests based on criteria (case-insensitive)."""
+        search_lower = search_term.lower() if search_term else None
+        _, questions, q_lower, by_tech, by_diff = self._get_search_index()
+        # Positions of candidate questions, in storage order; None means all of them
+        candidates = None
+        if technology:
+            candidates = by_tech.get(technology.lower())
+            if not candidates:
+                return []
+        if difficulty:
+            bucket = by_diff.get(difficulty.lower())
+            if not bucket:
+                return []
+            if candidates is None:
+                candidates = bucket
+            else:
+                # Walk the smaller bucket, probing the larger one as a set
+                smaller, larger = sorted((candidates, bucket), key=len)
+                larger = set(larger)
+                candidates = [i for i in smaller if i in larger]
+        if search_lower is None:
+            return questions[:] if candidates is None else [questions[i] for i in candidates]
+        if candidates is None:
+            # No filters: scan the lowercased text directly, without position lookups
+            return [q for q, text in zip(questions, q_lower) if search_lower in text]
+        return [questions[i] for i in candidates if search_lower in q_lower[i]]
 
     def get_analytics(self) -> Dict[str, Any]:
         """Get analytics data about tests."""
+        fingerprint = self.get_tests_fingerprint()
+        if self._analytics is None or fingerprint != self._analytics_fingerprint:
+            self._analytics = self._compute_analytics()
+            self._analytics_fingerprint = fingerprint
+        # Copy the distributions so callers can't mutate the cached result
+        analytics = dict(self._analytics)
+        analytics['difficulty_distribution'] = dict(analytics['difficulty_distribution'])
+        analytics['technology_distribution'] = dict(analytics['technology_distribution'])
+        return analytics
+
+    def _compute_analytics(self) -> Dict[str, Any]:
+        """Compute analytics in one pass over the tests index."""
         all_tests = self.file_storage.load_tests()
         total_tests = 0
         total_sets = len(all_tests)
         technologies = set()
-        difficulties = {}
-        technology_distribution = {}
+        difficulties = Counter()
+        technology_distribution = Counter()
+        # Every question of a set shares the set's technology and difficulty,
+        # so the index metadata weighted by total_tests gives the same counts
         for test_set in all_tests:
-            tests = test_set.get('tests', [])
-            total_tests += len(tests)
-            for test in tests:
-                technology = test.get('technology', 'Unknown')
-                technologies.add(technology)
-                technology_distribution[technology] = technology_distribution.get(technology, 0) + 1
-                difficulty = test.get('difficulty', 'Unknown')
-                difficulties[difficulty] = difficulties.get(difficulty, 0) + 1
+            count = test_set.get('total_tests', 0)
+            if not count:
+                continue
+            total_tests += count
+            metadata = test_set.get('metadata', {})
+            technology = metadata.get('technology', 'Unknown')
+            technologies.add(technology)
+            technology_distribution[technology] += count
+            difficulties[metadata.get('difficulty', 'Unknown')] += count
         return {
             'total_tests': total_tests,
             'total_sets': total_sets,
             'total_technologies': len(technologies),
             'avg_tests_per_set': round(total_tests / total_sets, 2) if total_sets > 0 else 0,
-            'difficulty_distribution': difficulties,
-            'technology_distribution': technology_distribution
+            'difficulty_distribution': dict(difficulties),
+            'technology_distribution': dict(technology_distribution)
         }
 
     def delete_test_set(self, test_set_id: str) -> bool:
         """Delete a test set."""
+        self._invalidate_caches()
         return self.file_storage.delete_test_set(test_set_id)
 
     def update_test_set(self, test_set_id: str, updated_data: Dict[str, Any]) -> bool:
         """Update a test set."""
+        self._invalidate_caches()
         return self.file_storage.update_test_set(test_set_id, updated_data)
 
     def export_tests(self, test_set_id: str, format: str = "json") -> Optional[str]:
@@ -138,15 +221,40 @@ class TestGenerationService:
         """Get storage statistics."""
         return self.file_storage.get_storage_stats()
 
-    def get_supported_technologies(self) -> List[str]:
-        """Get list of supported technologies."""
-        return [
-            "Python", "JavaScript", "Java", "C++", "Ruby", "PHP",
-            "TypeScript", "Go", "Rust", "Swift", "Kotlin", "C#",
-            "React", "Angular", "Vue.js", "Node.js", "Django", "Flask",
-            "Spring Boot", "Express.js", "MongoDB", "PostgreSQL", "MySQL"
-        ]
+    # Async variants for callers running inside an event loop; the blocking
+    # storage work runs on a worker thread so the loop stays responsive
+    async def save_test_async(self, tests: List[Dict[str, Any]], test_name: str) -> str:
+        """Async version of save_test."""
+        return await asyncio.to_thread(self.save_test, tests, test_name)
+
+    async def get_all_tests_async(self) -> List[Dict[str, Any]]:
+        """Async version of get_all_tests."""
+        return await asyncio.to_thread(self.get_all_tests)
+
+    async def search_tests_async(self, search_term: str = None, technology: str = None, difficulty: str = None) -> List[Dict[str, Any]]:
+        """Async version of search_tests."""
+        return await asyncio.to_thread(self.search_tests, search_term, technology, difficulty)
+
+    async def get_analytics_async(self) -> Dict[str, Any]:
+        """Async version of get_analytics."""
+        return await asyncio.to_thread(self.get_analytics)
+
+    async def delete_test_set_async(self, test_set_id: str) -> bool:
+        """Async version of delete_test_set."""
+        return await asyncio.to_thread(self.delete_test_set, test_set_id)
+
+    async def update_test_set_async(self, test_set_id: str, updated_data: Dict[str, Any]) -> bool:
+        """Async version of update_test_set."""
+        return await asyncio.to_thread(self.update_test_set, test_set_id, updated_data)
+
+    async def export_tests_async(self, test_set_id: str, format: str = "json") -> Optional[str]:
+        """Async version of export_tests."""
+        return await asyncio.to_thread(self.export_tests, test_set_id, format)
+
+    def get_supported_technologies(self) -> Tuple[str, ...]:
+        """Get the (shared, immutable) tuple of supported technologies."""
+        return _SUPPORTED_TECHNOLOGIES
 
-    def get_difficulty_levels(self) -> List[str]:
-        """Get list of supported difficulty levels."""
-        return ["beginner", "intermediate", "advanced"] 
\ No newline at end of file
+    def get_difficulty_levels(self) -> Tuple[str, ...]:
+        """Get the (shared, immutable) tuple of supported difficulty levels."""
+        return _DIFFICULTY_LEVELS 
\ No newline at end of file
@@ -0,0 +1,38 @@
+import html
+from typing import Dict
+
+# Option letters in display order
+OPTION_KEYS = ('a', 'b', 'c', 'd')
+
+# Inline styles for a rendered option row
+NEUTRAL_OPTION_STYLE = "margin: 4px 0; padding: 4px 8px;"
+CORRECT_OPTION_STYLE = "margin: 4px 0; padding: 4px 8px; color: #256029; background-color: #C8E6C9; border-radius: 4px; width: fit-content; font-weight: bold;"
+INCORRECT_OPTION_STYLE = "margin: 4px 0; padding: 4px 8px; color: #B71C1C; background-color: #FFCDD2; border-radius: 4px; width: fit-content; font-weight: bold;"
+
+
+def _option_tag(key: str, style: str) -> str:
+    """Opening tag of an option row; doubles as the substitution token for highlighting."""
+    return f"<div data-option='{key}' style='{style}'>"
+
+
+def build_options_html(options: Dict[str, str]) -> str:
+    """Render the neutral (unanswered) options block with HTML-escaped option text (non-strings are str()-ed)."""
+    return "".join(
+        f"{_option_tag(k, NEUTRAL_OPTION_STYLE)}{k}. {html.escape(str(options.get(k, '')))}</div>"
+        for k in OPTION_KEYS
+    )
+
+
+def highlight_options_html(options_html: str, correct_key: str, selected_key: str) -> str:
+    """Overlay the correct and incorrect-selection styles on a neutral options block."""
+    if selected_key != correct_key:
+        options_html = options_html.replace(
+            _option_tag(selected_key, NEUTRAL_OPTION_STYLE),
+            _option_tag(selected_key, INCORRECT_OPTION_STYLE),
+            1,
+        )
+    return options_html.replace(
+        _option_tag(correct_key, NEUTRAL_OPTION_STYLE),
+        _option_tag(correct_key, CORRECT_OPTION_STYLE),
+        1,
+    )
@@ -4,10 +4,16 @@ Combines the best features of both the original langgraph workflow and the test_
 """
 
 import os
+import re
+import asyncio
+import functools
 import json
 import logging
-from typing import TypedDict, List, Dict, Optional, Any
+import threading
+from typing import TypedDict, List, Dict, Optional, Any, Set
 from langgraph.graph import StateGraph, END
+import streamlit as st
+from utils.question_html import build_options_html
 
 # --- Load environment variables from .env if present ---
 try:
@@ -19,10 +25,188 @@ except ImportError:
 
 import google.generativeai as genai
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data: Any) -> Any:
+    """Parse JSON text, using orjson when it is installed (its decode error subclasses json's)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 # --- Logging Setup ---
 logging.basicConfig(level=logging.WARNING, format="[%(levelname)s] %(message)s")
 logger = logging.getLogger("test_generation_workflow")
 
+# --- Concurrency Limits ---
+# Cap on in-flight Gemini requests while questions are generated in parallel
+MAX_CONCURRENT_REQUESTS = 5
+# Extra parallel rounds allowed to replace duplicate or invalid questions
+MAX_TOPUP_ROUNDS = 3
+
+
+# --- Shared Model Clients ---
+@functools.lru_cache(maxsize=4)
+def _get_model(model_name: str) -> genai.GenerativeModel:
+    """Return the process-wide GenerativeModel for a model name (the API key is set globally by genai.configure)."""
+    return genai.GenerativeModel(model_name)
+
+
+# --- Background Event Loop ---
+# Sync callers share one long-lived loop instead of asyncio.run per call, so the
+# Gemini client's async channels (bound to the loop that created them) stay open
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_LOOP_LOCK = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Start the shared event loop thread on first use and return its loop."""
+    global _LOOP
+    with _LOOP_LOCK:
+        if _LOOP is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="test-generation-loop", daemon=True
+            ).start()
+            _LOOP = loop
+    return _LOOP
+
+
+def run_coroutine_sync(coro) -> Any:
+    """Run a coroutine on the shared background loop and wait for its result.
+
+    Safe to call from threads that already run their own event loop (e.g. Jupyter),
+    since the coroutine always runs on the background loop's thread.
+    """
+    loop = _get_background_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        # Blocking on .result() here would wait on this very loop forever
+        coro.close()
+        raise RuntimeError("Cannot block on the background loop from inside it; await the coroutine instead")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+async def run_on_background_loop(coro) -> Any:
+    """Await a coroutine run on the shared background loop from any other event loop."""
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, _get_background_loop()))
+
+
+# --- Response Parsing ---
+# Patterns are compiled once at import; they run on every LLM response
+_CODE_FENCE_START_RE = re.compile(r"^```[a-zA-Z]*")
+_CODE_FENCE_END_RE = re.compile(r"```$")
+_JSON_OBJ_RE = re.compile(r"\{.*\}", re.DOTALL)
+_JSON_ARRAY_RE = re.compile(r"\[.*\]", re.DOTALL)
+_QUESTION_FIELDS = ("question", "options", "correct_answer", "explanation")
+_FIELD_RES = {field: re.compile(rf'"{field}"\s*:\s*(.*)') for field in _QUESTION_FIELDS}
+
+# --- Validation Constants ---
+_OPTION_KEYS = frozenset("abcd")
+_VALID_ANSWERS = _OPTION_KEYS
+_VALID_DIFFICULTIES = frozenset(("Easy", "Medium", "Hard"))
+
+
+def _extract_json_array(text: str) -> List[Any]:
+    """Extract the JSON array of questions from a batched LLM response."""
+    # Remove code block markers if present
+    text = _CODE_FENCE_START_RE.sub("", text).strip()
+    text = _CODE_FENCE_END_RE.sub("", text).strip()
+    try:
+        data = _json_loads(text)
+    except json.JSONDecodeError:
+        # Fall back to the outermost [...] span in case the LLM added surrounding text
+        array_match = _JSON_ARRAY_RE.search(text)
+        if not array_match:
+            raise ValueError(f"No JSON array found in LLM response: {text[:200]}...")
+        data = _json_loads(array_match.group())
+    # A single object is accepted as a batch of one
+    if isinstance(data, dict):
+        return [data]
+    if not isinstance(data, list):
+        raise ValueError("LLM response is not a JSON array")
+    return data
+
+
+# --- Single Question Parsing ---
+def _is_malformed_response(text: str) -> bool:
+    """Cheap pre-check for responses that cannot contain a question object."""
+    return not text or '"question"' not in text or '"options"' not in text
+
+
+# Some times the LLM response is not a valid JSON object. So we need to extract it manually.
+# This function will try to extract the JSON object from the text and we will not need any LLM calls for this validation
+def _extract_json(text: str) -> Dict[str, Any]:
+    """Extract a single question object from an LLM response, tolerating malformed JSON."""
+    # Fast path: the prompt asks for a bare JSON object, which most responses are
+    stripped = text.strip()
+    if stripped.startswith("{") and stripped.endswith("}"):
+        try:
+            return _json_loads(stripped)
+        except json.JSONDecodeError:
+            pass
+
+    # Remove code block markers if present
+    text = _CODE_FENCE_START_RE.sub("", text).strip()
+    text = _CODE_FENCE_END_RE.sub("", text).strip()
+
+    # Find the first JSON object in the text. the re.DOTALL is used to match across multiple lines.
+    json_match = _JSON_OBJ_RE.search(text)
+    # If the text contains a JSON object, return it.
+    if json_match:
+        json_str = json_match.group()
+        return _json_loads(json_str)
+    
+    # Fallback: if the text contains '"question"' but no braces, try wrapping in {}
+    if '"question"' in text and not text.strip().startswith("{"):
+        try_str = "{" + text.strip().strip(",") + "}"
+        logger.debug("Attempting fallback parse: %s", try_str)
+        try:
+            return _json_loads(try_str)
+        except Exception as e:
+            logger.error(
+                f"Failed fallback parse. Attempted string: {try_str}\nRaw response: {text}"
+            )
+            raise
+    
+    # Failsafe: try to extract fields line by line. This is a fallback mechanism to handle cases where the JSON object is not properly formatted.
+    result = {}
+    for field, field_re in _FIELD_RES.items():
+        # This regex will match the field name and the value.
+        field_match = field_re.search(text)
+        # If the field is found, extract the value.
+        if field_match:
+            value = field_match.group(1).strip().rstrip(",")
+            # Remove quotes for non-list fields.
+            if field == "options":
+                try:
+                    result[field] = _json_loads(value)
+                except Exception:
+                    result[field] = {"a": "", "b": "", "c": "", "d": ""}
+            else:
+                if value.startswith('"') and value.endswith('"'):
+                    value = value[1:-1]
+                result[field] = value
+    # If the result has all the fields, return it.
+    if len(result) == len(_QUESTION_FIELDS):
+        logger.debug("Failsafe extraction result: %s", result)
+        return result
+    # Final attempt: try to parse the whole text
+    logger.debug("Final attempt, trying to parse whole text: %s", text)
+    try:
+        return _json_loads(text)
+    except Exception as e:
+        # All parsing attempts failed - raise a proper error
+        error_msg = f"Failed to parse LLM response after all attempts. Raw response: {text[:200]}..."
+        logger.error(error_msg)
+        raise ValueError(error_msg)
+
 
 # --- Data Structures ---
 class Question(TypedDict):
@@ -31,6 +215,7 @@ class Question(TypedDict):
         str, str
     ]  # {'a': 'option a', 'b': 'option b', 'c': 'option c', 'd': 'option d'}
     answer: Dict[str, str]  # {'answer': 'a', 'explanation': 'explanation text'}
+    options_html: str  # Neutral options block rendered once at generation time
 
 
 class WorkflowState(TypedDict):
@@ -40,12 +225,16 @@ class WorkflowState(TypedDict):
     errors: List[str]
     num_questions: int
     current_question: Optional[Dict[str, Any]]
+    seen_questions: Set[str]  # Normalized text of accepted questions, for O(1) duplicate checks
 
 
 class TestGenerationWorkflow:
     """Test generation workflow with technology and difficulty support."""
 
-    def __init__(self):
+    def __init__(self, use_graph: bool = False):
+        # Independent questions skip the langgraph loop unless the graph is requested
+        self.use_graph = use_graph
+
         # Initialize Google Generative AI
         self.api_key = os.environ.get("GEMINI_API_KEY")
         if not self.api_key:
@@ -55,6 +244,8 @@ class TestGenerationWorkflow:
 
         self.model_name = os.environ.get("GEMINI_MODEL_NAME", "gemini-2.0-flash")
         genai.configure(api_key=self.api_key)
+        # One model client reused by every LLM call, shared with other workflows of the same model
+        self._model = _get_model(self.model_name)
 
         # Create the question generation prompt template
         self.prompt_template = (
@@ -77,11 +268,84 @@ class TestGenerationWorkflow:
             "Use one of the following difficulty levels: Easy, Medium, Hard."
         )
 
-    def generate_single_question(self, state: WorkflowState) -> WorkflowState:
+        # Prompt used to request every question of a test in a single LLM call
+        self.batch_prompt_template = (
+            "You are an expert technical interviewer specializing in {technology}. "
+            "Generate {count} distinct multiple choice questions at {difficulty} level difficulty.\n\n"
+            "Requirements:\n"
+            "- Each question should be clear, concise, and end with a question mark\n"
+            '- Provide exactly 4 options per question, as a dictionary with keys a, b, c, d (e.g., {{"a": "option a", ...}})\n'
+            "- The questions should be challenging but appropriate for {difficulty} level\n"
+            "- Do not repeat questions or ask about the same concept twice\n"
+            "- Include a brief explanation for each correct answer\n"
+            "IMPORTANT: Respond ONLY with a single valid JSON array of {count} objects, with no markdown, no explanation, and no extra text. Your response MUST start with '[' and end with ']'.\n"
+            "Format each element as JSON:\n"
+            "{{\n"
+            '    "question": "Your question here?",\n'
+            '    "options": {{"a": "option a", "b": "option b", "c": "option c", "d": "option d"}},\n'
+            '    "correct_answer": "a",\n'
+            '    "explanation": "Brief explanation of why this is correct"\n'
+            "}}\n\n"
+            "Focus on {technology} concepts, best practices, and common scenarios.\n"
+            "Use one of the following difficulty levels: Easy, Medium, Hard."
+        )
+
+        # The graph never changes, so compile it once instead of per generate_test call
+        self._compiled_graph = self.create_workflow()
+
+    async def generate_question_batch(self, state: WorkflowState) -> WorkflowState:
+        """Generate all requested questions with one LLM call; the per-question loop only tops up shortfalls."""
+        try:
+            prompt = self.batch_prompt_template.format(
+                technology=state["technology"],
+                difficulty=state["difficulty"],
+                count=state["num_questions"],
+            )
+            response = await self._model.generate_content_async(prompt)
+            items = _extract_json_array(response.text.strip())
+
+            added_before = len(state["questions"])
+            for item in items:
+                if len(state["questions"]) >= state["num_questions"]:
+                    break
+                # A bad item only costs itself, not the valid questions around it
+                try:
+                    if isinstance(item, dict) and self._validate_question_data(item):
+                        state["current_question"] = self._format_question(item)
+                        self.validate_and_add_question(state)
+                    else:
+                        state["errors"].append("Invalid question format received from LLM")
+                except Exception as e:
+                    logger.error(f"Error processing batch item: {str(e)}")
+                    state["errors"].append(f"Error processing batch item: {str(e)}")
+                    state["current_question"] = None
+            # Like the single-question path, a productive call resets the error budget
+            if len(state["questions"]) > added_before:
+                state["errors"] = []
+        except Exception as e:
+            logger.error(f"Error generating question batch: {str(e)}")
+            state["errors"].append(f"Error generating question batch: {str(e)}")
+        state["current_question"] = None
+        return state
+
+    def _format_question(self, question_data: Dict[str, Any]) -> Question:
+        """Convert validated LLM output into the stored question format."""
+        # No need to convert options, already a dict
+        return {
+            "question": question_data["question"],
+            "options": question_data["options"],
+            "answer": {
+                "answer": question_data["correct_answer"],
+                "explanation": question_data["explanation"],
+            },
+            "options_html": build_options_html(question_data["options"]),
+        }
+
+    async def generate_single_question(self, state: WorkflowState) -> WorkflowState:
         """Generate a single question using the LLM."""
         try:
-            print(
-                f"[DEBUG] Generating question for {state['technology']} at {state['difficulty']} difficulty"
+            logger.debug(
+                "Generating question for %s at %s difficulty", state["technology"], state["difficulty"]
             )
             # Get previous questions to avoid repetition
             # previous_questions = "; ".join([q["question"] for q in state["questions"]]) if state["questions"] else "None"
@@ -93,98 +357,27 @@ class TestGenerationWorkflow:
                     difficulty=state["difficulty"],
                     # previous_questions=""
                 )
-                print(f"[DEBUG] Prompt: {prompt}")
-            except Exception as e:
-                print(f"[ERROR] Error formatting prompt: {e}")
+                logger.debug("Prompt: %s", prompt)
+            except Exception:
+                logger.exception("Error formatting prompt")
                 return state
-            # Get response from Gemini LLM
-            model = genai.GenerativeModel(self.model_name)
-
-            # Generate content from the model
-            response = model.generate_content(prompt)
-            print(f"[DEBUG] Raw LLM response: {response.text}")
+            # Get response from Gemini LLM without blocking the event loop
+            response = await self._model.generate_content_async(prompt)
+            logger.debug("Raw LLM response: %s", response.text)
             text = response.text.strip()
 
-            # --- Robust JSON extraction from the response ---
-            # Some times the LLM response is not a valid JSON object. So we need to extract it manually.
-            # This function will try to extract the JSON object from the text and we will not need any LLM calls for this validation
-            def extract_json(text):
-                import re, json
-
-                # Remove code block markers if present
-                text = re.sub(r"^```[a-zA-Z]*", "", text).strip()
-                text = re.sub(r"```$", "", text).strip()
-
-                # Find the first JSON object in the text. the re.DOTALL is used to match across multiple lines.
-                json_match = re.search(r"\{.*\}", text, re.DOTALL)
-                # If the text contains a JSON object, return it.
-                if json_match:
-                    json_str = json_match.group()
-                    return json.loads(json_str)
-                
-                # Fallback: if the text contains '"question"' but no braces, try wrapping in {}
-                if '"question"' in text and not text.strip().startswith("{"):
-                    try_str = "{" + text.strip().strip(",") + "}"
-                    print(f"[DEBUG] Attempting fallback parse: {try_str}")
-                    try:
-                        return json.loads(try_str)
-                    except Exception as e:
-                        logger.error(
-                            f"Failed fallback parse. Attempted string: {try_str}\nRaw response: {text}"
-                        )
-                        print(
-                            f"[ERROR] Failed fallback parse. Attempted string: {try_str}\nRaw response: {text}"
-                        )
-                        raise
-                
-                # Failsafe: try to extract fields line by line. This is a fallback mechanism to handle cases where the JSON object is not properly formatted.
-                fields = ["question", "options", "correct_answer", "explanation"]
-                result = {}
-                for field in fields:
-                    # This regex will match the field name and the value.
-                    field_match = re.search(rf'"{field}"\s*:\s*(.*)', text)
-                    # If the field is found, extract the value.
-                    if field_match:
-                        value = field_match.group(1).strip().rstrip(",")
-                        # Remove quotes for non-list fields.
-                        if field == "options":
-                            try:
-                                result[field] = json.loads(value)
-                            except Exception:
-                                result[field] = {"a": "", "b": "", "c": "", "d": ""}
-                        else:
-                            if value.startswith('"') and value.endswith('"'):
-                                value = value[1:-1]
-                            result[field] = value
-                # If the result has all the fields, return it.
-                if set(result.keys()) == set(fields):
-                    print(f"[DEBUG] Failsafe extraction result: {result}")
-                    return result
-                # Final attempt: try to parse the whole text
-                print(f"[DEBUG] Final attempt, trying to parse whole text: {text}")
-                try:
-                    return json.loads(text)
-                except Exception as e:
-                    # All parsing attempts failed - raise a proper error
-                    error_msg = f"Failed to parse LLM response after all attempts. Raw response: {text[:200]}..."
-                    logger.error(error_msg)
-                    raise ValueError(error_msg)
+            # Responses that can't hold a question skip the costly extraction fallbacks
+            if _is_malformed_response(text):
+                state["errors"].append("Malformed LLM response")
+                state["current_question"] = None
+                return state
 
             # Parse the JSON response
             try:
-                question_data = extract_json(text)
+                question_data = _extract_json(text)
                 # Validate the response structure
                 if self._validate_question_data(question_data):
-                    # No need to convert options, already a dict
-                    formatted_question = {
-                        "question": question_data["question"],
-                        "options": question_data["options"],
-                        "answer": {
-                            "answer": question_data["correct_answer"],
-                            "explanation": question_data["explanation"],
-                        },
-                    }
-                    state["current_question"] = formatted_question
+                    state["current_question"] = self._format_question(question_data)
                     state["errors"] = []
                 else:
                     state["errors"].append("Invalid question format received from LLM")
@@ -212,60 +405,87 @@ class TestGenerationWorkflow:
 
     def _validate_question_data(self, data: Dict[str, Any]) -> bool:
         """Validate the question data structure."""
-        required_fields = ["question", "options", "correct_answer", "explanation"]
-
         # Check if all required fields exist
-        if not all(field in data for field in required_fields):
-            return False
-
-        # Check if question is not empty and ends with question mark
-        if not data["question"] or not data["question"].strip().endswith("?"):
+        if not all(field in data for field in _QUESTION_FIELDS):
             return False
 
+        # Cheap membership checks first, string work last
         # Check if options is a dict with exactly 4 keys a, b, c, d
-        if not isinstance(data["options"], dict) or set(data["options"].keys()) != {
-            "a",
-            "b",
-            "c",
-            "d",
-        }:
+        if not isinstance(data["options"], dict) or data["options"].keys() != _OPTION_KEYS:
             return False
 
         # Check if correct_answer is valid
-        if data["correct_answer"] not in ["a", "b", "c", "d"]:
+        if not isinstance(data["correct_answer"], str) or data["correct_answer"] not in _VALID_ANSWERS:
             return False
 
-        # Check if explanation is not empty
-        if not data["explanation"] or len(data["explanation"].strip()) < 10:
+        # Check if difficulty is valid (if present)
+        if "difficulty" in data and (
+            not isinstance(data["difficulty"], str) or data["difficulty"] not in _VALID_DIFFICULTIES
+        ):
             return False
 
-        # Check if difficulty is valid (if present)
-        if "difficulty" in data and data["difficulty"] not in [
-            "Easy",
-            "Medium",
-            "Hard",
-        ]:
+        # Check if question is not empty and ends with question mark
+        if not data["question"] or not data["question"].strip().endswith("?"):
+            return False
+
+        # Check if explanation is not empty
+        if not data["explanation"] or len(data["explanation"].strip()) < 10:
             return False
 
         return True
 
+    async def _generate_one(
+        self, technology: str, difficulty: str, semaphore: asyncio.Semaphore
+    ) -> Question:
+        """Generate and validate one question with a single async LLM call."""
+        prompt = self.prompt_template.format(technology=technology, difficulty=difficulty)
+        async with semaphore:
+            response = await self._model.generate_content_async(prompt)
+        text = response.text.strip()
+        if _is_malformed_response(text):
+            raise ValueError("Malformed LLM response")
+        question_data = _extract_json(text)
+        if not self._validate_question_data(question_data):
+            raise ValueError("Invalid question format received from LLM")
+        return self._format_question(question_data)
+
+    async def _gather_generate(self, state: WorkflowState) -> WorkflowState:
+        """Generate the missing questions concurrently, topping up duplicates and failures."""
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        for _ in range(1 + MAX_TOPUP_ROUNDS):
+            missing = state["num_questions"] - len(state["questions"])
+            if missing <= 0:
+                break
+            results = await asyncio.gather(
+                *(
+                    self._generate_one(state["technology"], state["difficulty"], semaphore)
+                    for _ in range(missing)
+                ),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    state["errors"].append(f"Error generating question: {str(result)}")
+                else:
+                    state["current_question"] = result
+                    self.validate_and_add_question(state)
+        return state
+
     def validate_and_add_question(self, state: WorkflowState) -> WorkflowState:
         """Validate the current question and add it to the list if valid."""
         current_question = state.get("current_question")
 
         if current_question:
             # Check for duplicates
-            is_duplicate = any(
-                q["question"].lower() == current_question["question"].lower()
-                for q in state["questions"]
-            )
+            key = current_question["question"].strip().lower()
 
-            if is_duplicate:
+            if key in state["seen_questions"]:
                 state["errors"].append("Duplicate question detected")
                 state["current_question"] = None
             else:
                 # Add the question to the list
                 state["questions"].append(current_question)
+                state["seen_questions"].add(key)
                 state["current_question"] = None
                 logger.info(
                     f"Added question {len(state['questions'])}/{state['num_questions']}"
@@ -295,10 +515,16 @@ class TestGenerationWorkflow:
         workflow = StateGraph(WorkflowState)
 
         # Add nodes
+        workflow.add_node("batch", self.generate_question_batch)
         workflow.add_node("generate", self.generate_single_question)
         workflow.add_node("validate", self.validate_and_add_question)
 
         # Add edges
+        # The batch node requests every question in one call; any shortfall falls through to the per-question loop.
+        workflow.add_conditional_edges(
+            "batch", self.should_continue, {"generate": "generate", END: END}
+        )
+
         # This is the main Edge and it will always go from generating a question to validating it.
         workflow.add_edge("generate", "validate")
 
@@ -308,12 +534,16 @@ class TestGenerationWorkflow:
         )
 
         # Set entry point
-        workflow.set_entry_point("generate")
+        workflow.set_entry_point("batch")
 
         return workflow.compile()
 
     async def generate_test(
-        self, technology: str, difficulty: str = "Medium", num_questions: int = 5
+        self,
+        technology: str,
+        difficulty: str = "Medium",
+        num_questions: int = 5,
+        use_graph: Optional[bool] = None,
     ) -> Dict[str, Any]:
         """
         Generate a test with the specified parameters.
@@ -322,6 +552,8 @@ class TestGenerationWorkflow:
             technology (str): The technology to generate questions for
             difficulty (str): The difficulty level ("Easy", "Medium", "Hard")
             num_questions (int): Number of questions to generate
+            use_graph (Optional[bool]): Run the langgraph batch/generate/validate loop instead of
+                generating the questions concurrently; defaults to self.use_graph
 
         Returns:
             Dict[str, Any]: A dictionary containing the test questions and any errors
@@ -334,13 +566,19 @@ class TestGenerationWorkflow:
             "errors": [],
             "num_questions": num_questions,
             "current_question": None,
+            "seen_questions": set(),
         }
 
-        # Create and run the workflow
-        workflow = self.create_workflow()
+        if use_graph is None:
+            use_graph = self.use_graph
 
         try:
-            await workflow.ainvoke(state)
+            if use_graph:
+                # Run the compiled workflow
+                await self._compiled_graph.ainvoke(state)
+            else:
+                # Questions are independent, so bypass the graph and overlap their LLM calls
+                await self._gather_generate(state)
         except Exception as e:
             state["errors"].append(f"Workflow execution error: {str(e)}")
 
@@ -357,9 +595,13 @@ class TestGenerationWorkflow:
         self, technology: str, difficulty: str = "Medium", num_questions: int = 5
     ) -> Dict[str, Any]:
         """Synchronous version of generate_test."""
-        import asyncio
+        return run_coroutine_sync(self.generate_test(technology, difficulty, num_questions))
+
 
-        return asyncio.run(self.generate_test(technology, difficulty, num_questions))
+@st.cache_resource
+def get_workflow() -> TestGenerationWorkflow:
+    """Return a single TestGenerationWorkflow shared across reruns and sessions."""
+    return TestGenerationWorkflow()
 
 
 # If we directly want to execute the workflow, we can use this function independently
@@ -380,7 +622,7 @@ def export_workflow_png(output_path="src/services/workflow_graph.png"):
     Args:
         output_path (str): The path to save the workflow graph as a PNG image
     """
-    workflow = TestGenerationWorkflow().create_workflow()
+    workflow = TestGenerationWorkflow()._compiled_graph
     graph = workflow.get_graph()
     graph.draw_png(output_path)
     print(f"Workflow graph exported to {output_path}")